@@ -0,0 +1,19 @@
+"""
+ASGI entry point for the Flask Blog API.
+
+Wraps the WSGI application for hosts that can only run ASGI applications:
+
+    uvicorn asgi:asgi_app --port 5001
+
+This adds no concurrency. asgiref runs the WSGI application on a single
+thread per process, one request at a time, and reads each request body in
+full before passing it on. Where a WSGI server is available, serve
+`backend_app:app` with gunicorn instead (see gunicorn.conf.py), whose
+threaded workers handle requests concurrently.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+from backend_app import app
+
+
+asgi_app = WsgiToAsgi(app)
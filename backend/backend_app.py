@@ -5,18 +5,37 @@ This module provides a RESTful API for creating, reading, updating, and deleting
 It includes features such as pagination, sorting, search, rate limiting, and API key authentication.
 """
 
-from flask import Flask, jsonify, request, abort, send_from_directory
+from flask import Flask, Response, request, abort
 from flask_cors import CORS
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from flask_swagger_ui import get_swaggerui_blueprint
 from marshmallow import Schema, fields, ValidationError
-import json
+import orjson
 import logging
+import atexit
+import hashlib
+import heapq
+import hmac
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache
 from math import ceil
+from operator import itemgetter
+from urllib.parse import parse_qs
 from datetime import datetime
 from config import Config
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 
 # Set up logging configuration
 logger = logging.getLogger(__name__)
@@ -26,24 +45,232 @@ formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
+
+def json_response(data, status=200):
+    """
+    Build a JSON response encoded directly with orjson.
+
+    Args:
+        data: JSON-serializable response data
+        status (int): HTTP status code
+
+    Returns:
+        Response: Response with an application/json body
+    """
+    return Response(orjson.dumps(data), status=status, mimetype='application/json')
+
+
+def prebuilt_response(body, status):
+    """
+    Build a JSON response from an already encoded body.
+
+    Used for fixed error responses whose bodies are encoded once at import.
+
+    Args:
+        body (bytes): Encoded JSON body
+        status (int): HTTP status code
+
+    Returns:
+        Response: Response with an application/json body
+    """
+    return Response(body, status=status, mimetype='application/json')
+
+
+def parse_json_body():
+    """
+    Parse the request body as JSON.
+
+    Returns:
+        The decoded JSON data
+
+    Raises:
+        HTTPException: 400 if the body is not valid JSON
+    """
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        abort(400, description="Request body must be valid JSON.")
+
+
 # Initialize core application components
 app = Flask(__name__)
 app.config.from_object(Config)
 CORS(app)
 
-# Set up rate limiting with configured defaults
-limiter = Limiter(
-    get_remote_address,
-    app=app,
-    default_limits=Config.RATE_LIMITS,
-    storage_uri="memory://"
+# Rate limiting: fixed-window counters keyed by (client, endpoint, window length, window number)
+RATE_LIMIT_PERIODS = {
+    "second": 1, "minute": 60, "hour": 3600, "day": 86400, "month": 30 * 86400, "year": 365 * 86400
+}
+RATE_LIMIT_RULE = re.compile(
+    r"\s*(\d+)\s*(?:/|per)\s*(\d+)?\s*(second|minute|hour|day|month|year)s?\s*$", re.IGNORECASE
 )
+RATE_LIMIT_COUNTERS = {}
+RATE_LIMIT_LOCK = threading.Lock()
+ENDPOINT_RATE_LIMITS = {}
+
+# Seconds between sweeps that drop the counters of windows that have ended
+RATE_LIMIT_PRUNE_INTERVAL = 60
+rate_limit_next_prune = 0
+
+
+def parse_rate_limit(rule):
+    """
+    Parse a rate limit rule such as "10 per minute", "100/hour" or "10 per 2 minutes".
+
+    Args:
+        rule (str): Rate limit rule
+
+    Returns:
+        tuple: (maximum requests, window length in seconds, encoded 429 response body)
+
+    Raises:
+        ValueError: If the rule is not understood
+    """
+    match = RATE_LIMIT_RULE.match(rule)
+    if not match:
+        raise ValueError(f"Invalid rate limit rule: {rule!r}")
+    count, multiplier, unit = match.groups()
+    if int(multiplier or 1) < 1:
+        raise ValueError(f"Invalid rate limit rule: {rule!r} (the window must be at least one {unit.lower()})")
+    limit, period = int(count), int(multiplier or 1) * RATE_LIMIT_PERIODS[unit.lower()]
+    body = orjson.dumps({
+        "error": "Too Many Requests",
+        "message": f"429 Too Many Requests: Rate limit exceeded: {limit} per {period} seconds."
+    })
+    return limit, period, body
+
+
+def parse_configured_rate_limits(rules):
+    """
+    Parse the configured default rate limit rules, skipping invalid ones.
+
+    Args:
+        rules (list): Rate limit rules, see `parse_rate_limit`
+
+    Returns:
+        list: Parsed rate limits
+    """
+    limits = []
+    for rule in rules:
+        if not rule.strip():
+            continue
+        try:
+            limits.append(parse_rate_limit(rule))
+        except ValueError as err:
+            logger.error(f"{err}; ignoring it")
+    return limits
+
+
+DEFAULT_RATE_LIMITS = parse_configured_rate_limits(Config.RATE_LIMITS)
+BEHIND_PROXY = Config.BEHIND_PROXY
+
+
+def client_address(environ):
+    """
+    Get the address that rate limits are counted against.
+
+    Behind a reverse proxy (BEHIND_PROXY), this is the last X-Forwarded-For
+    entry, the one appended by the proxy itself; earlier entries are sent
+    by the client and could be forged to dodge the limits.
+
+    Args:
+        environ (dict): WSGI environment of the request
+
+    Returns:
+        str: Client address
+    """
+    if BEHIND_PROXY:
+        forwarded_for = environ.get('HTTP_X_FORWARDED_FOR')
+        if forwarded_for:
+            return forwarded_for.rpartition(',')[2].strip()
+    return environ.get('REMOTE_ADDR')
+
+
+def rate_limit(rule):
+    """
+    Declare the rate limit for an endpoint, replacing the configured defaults.
+
+    Args:
+        rule (str): Rate limit rule, see `parse_rate_limit`
+
+    Returns:
+        function: Decorator that registers the limit for the view
+    """
+    limit = parse_rate_limit(rule)
+
+    def decorator(view):
+        ENDPOINT_RATE_LIMITS[view.__name__] = [limit]
+        return view
+    return decorator
+
+
+@app.before_request
+def enforce_rate_limits():
+    """
+    Count the request against the client's rate limits.
+
+    Responds with 429 once a limit is exceeded within the current window.
+    Rate limiting can be switched off with the RATELIMIT_ENABLED setting.
+    """
+    if not app.config.get("RATELIMIT_ENABLED", True):
+        return
+    endpoint = request.endpoint
+    body = hit_rate_limits(client_address(request.environ), endpoint,
+                           ENDPOINT_RATE_LIMITS.get(endpoint, DEFAULT_RATE_LIMITS))
+    if body is not None:
+        return prebuilt_response(body, 429)
+
+
+def hit_rate_limits(client, endpoint, limits):
+    """
+    Count a request against rate limits.
+
+    Args:
+        client (str): Client address
+        endpoint (str): Name the requests are counted under
+        limits (list): Rate limits, see `parse_rate_limit`
+
+    Returns:
+        bytes: Encoded 429 response body of the exceeded limit, or None if no limit is exceeded
+    """
+    global rate_limit_next_prune
+    now = int(time.time())
+    with RATE_LIMIT_LOCK:
+        if now >= rate_limit_next_prune:
+            prune_rate_limit_counters(now)
+            rate_limit_next_prune = now + RATE_LIMIT_PRUNE_INTERVAL
+        for limit, period, body in limits:
+            key = (client, endpoint, period, now // period)
+            count = RATE_LIMIT_COUNTERS.get(key, 0) + 1
+            RATE_LIMIT_COUNTERS[key] = count
+            if count > limit:
+                return body
+    return None
+
+
+def prune_rate_limit_counters(now):
+    """Drop counters of windows that have already ended. Must be called with RATE_LIMIT_LOCK held."""
+    expired = [key for key in RATE_LIMIT_COUNTERS if key[3] < now // key[2]]
+    for key in expired:
+        del RATE_LIMIT_COUNTERS[key]
+
+
+# The Swagger specification is static, so it is read once and served from memory
+with open(Config.BASE_DIR / 'static' / 'swagger.json', 'rb') as swagger_file:
+    SWAGGER_SPEC = swagger_file.read()
+SWAGGER_ETAG = hashlib.md5(SWAGGER_SPEC).hexdigest()
 
 
 @app.route('/swagger.json', methods=['GET'])
 def swagger_json():
     """Serve the Swagger JSON specification file."""
-    return send_from_directory(Config.BASE_DIR / 'static', 'swagger.json')
+    if request.if_none_match.contains(SWAGGER_ETAG):
+        response = Response(status=304)
+    else:
+        response = Response(SWAGGER_SPEC, mimetype='application/json')
+    response.set_etag(SWAGGER_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 
 # Configure Swagger UI endpoints
@@ -55,38 +282,98 @@ swagger_ui_blueprint = get_swaggerui_blueprint(
 )
 app.register_blueprint(swagger_ui_blueprint, url_prefix=SWAGGER_URL)
 
+# Authentication settings, resolved once at startup
+API_KEY = Config.API_KEY
+DEBUG_MODE = app.config["DEBUG"]
+NO_AUTH_PATHS = frozenset({API_URL})
+UNAUTHORIZED_BODY = orjson.dumps({
+    "error": "Unauthorized",
+    "message": "401 Unauthorized: Unauthorized: Invalid or missing API key."
+})
 
-@app.before_request
-def validate_api_key():
-    """
-    Validate the API key before processing any request.
 
-    Checks for API key in headers or query parameters when not in debug mode.
-    Raises 401 if the key is missing or invalid.
+UNAUTHORIZED_HEADERS = [
+    ('Content-Type', 'application/json'),
+    ('Content-Length', str(len(UNAUTHORIZED_BODY))),
+    ('Access-Control-Allow-Origin', '*'),
+]
+
+# Rejected API keys are rate limited per client, so keys cannot be guessed at full speed
+AUTH_FAILURE_RATE_LIMITS = [parse_rate_limit("10 per minute")]
+
+
+class APIKeyMiddleware:
     """
-    if app.config["DEBUG"]:
-        return
-    api_key = request.headers.get('X-API-Key') or request.args.get('api_key')
-    if not api_key or api_key != Config.API_KEY:
-        abort(401, description="Unauthorized: Invalid or missing API key.")
+    WSGI middleware that rejects requests without a valid API key.
+
+    Runs before Flask builds a request context, so a rejected request costs
+    only a few environ lookups. The key is read from the X-API-Key header
+    or, failing that, the api_key query parameter, and compared in constant
+    time. CORS preflight requests, the Swagger specification and the
+    Swagger UI are served without a key. Rejected requests are counted
+    against AUTH_FAILURE_RATE_LIMITS and answered with 429 once over them.
+    """
+
+    def __init__(self, wsgi_app, api_key):
+        """Wrap a WSGI application, accepting requests that carry the given key."""
+        self.wsgi_app = wsgi_app
+        self.api_key = (api_key or '').encode('utf-8')
+
+    def __call__(self, environ, start_response):
+        """Handle a WSGI request, answering 401 (or 429) if the API key is missing or invalid."""
+        path = environ.get('PATH_INFO', '')
+        if (environ['REQUEST_METHOD'] == 'OPTIONS' or path in NO_AUTH_PATHS
+                or path.startswith(SWAGGER_URL) or self.has_valid_key(environ)):
+            return self.wsgi_app(environ, start_response)
+        if app.config.get("RATELIMIT_ENABLED", True):
+            body = hit_rate_limits(client_address(environ), 'auth_failure', AUTH_FAILURE_RATE_LIMITS)
+            if body is not None:
+                start_response('429 TOO MANY REQUESTS', [
+                    ('Content-Type', 'application/json'),
+                    ('Content-Length', str(len(body))),
+                    ('Access-Control-Allow-Origin', '*'),
+                ])
+                return [body]
+        start_response('401 UNAUTHORIZED', UNAUTHORIZED_HEADERS)
+        return [UNAUTHORIZED_BODY]
+
+    def has_valid_key(self, environ):
+        """Check the API key of a request against the expected one."""
+        # WSGI passes headers and the query string as latin-1 decoded strings
+        api_key = environ.get('HTTP_X_API_KEY', '').encode('latin-1')
+        if not api_key:
+            query = environ.get('QUERY_STRING', '')
+            if 'api_key' in query:
+                api_key = parse_qs(query.encode('latin-1')).get(b'api_key', [b''])[0]
+        return bool(api_key) and hmac.compare_digest(api_key, self.api_key)
+
+
+if not DEBUG_MODE:
+    app.wsgi_app = APIKeyMiddleware(app.wsgi_app, API_KEY)
 
 
 @app.errorhandler(400)
 def bad_request(error):
     """Handle bad request errors with a JSON response."""
-    return jsonify({"error": "Bad Request", "message": str(error)}), 400
-
-
-@app.errorhandler(401)
-def unauthorized(error):
-    """Handle unauthorized access errors with a JSON response."""
-    return jsonify({"error": "Unauthorized", "message": str(error)}), 401
+    return json_response({"error": "Bad Request", "message": str(error)}, 400)
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle resource not found errors with a JSON response."""
-    return jsonify({"error": "Not Found", "message": str(error)}), 404
+    return json_response({"error": "Not Found", "message": str(error)}, 404)
+
+
+REQUEST_TOO_LARGE_BODY = orjson.dumps({
+    "error": "Request Entity Too Large",
+    "message": f"Request body must not exceed {Config.MAX_CONTENT_LENGTH} bytes."
+})
+
+
+@app.errorhandler(413)
+def request_too_large(error):
+    """Handle request bodies over MAX_CONTENT_LENGTH with a prebuilt JSON response."""
+    return prebuilt_response(REQUEST_TOO_LARGE_BODY, 413)
 
 
 class PostSchema(Schema):
@@ -98,10 +385,138 @@ class PostSchema(Schema):
     title = fields.Str(required=True)
     content = fields.Str(required=True)
     author = fields.Str(required=True)
-    date = fields.Date(required=True, format="%Y-%m-%d")
+    date = fields.Date(required=True)
 
 
 post_schema = PostSchema()
+post_schema_partial = PostSchema(partial=True)
+
+# Bound schema loaders for the create (full) and update (partial) endpoints
+load_post_data = post_schema.load
+load_post_update = post_schema_partial.load
+
+# Post fields that support case-insensitive searching
+SEARCHABLE_FIELDS = ('title', 'content', 'author', 'date')
+
+# Accepted values for the sort and direction query parameters
+SORT_FIELDS = frozenset(SEARCHABLE_FIELDS)
+SORT_DIRECTIONS = frozenset(('asc', 'desc'))
+
+# Buffer size used when writing the storage file
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Pages ending within 1/HEAP_PAGE_RATIO of the posts are selected with a heap
+# instead of sorting every post, when no sorted view is cached yet
+HEAP_PAGE_RATIO = 32
+
+# Seconds between background flushes of pending journal entries into the storage file
+FLUSH_INTERVAL = 5
+
+
+class PostSearchIndex:
+    """
+    In-memory SQLite FTS5 index over the searchable post fields.
+
+    The JSON storage file stays the source of truth; this index is derived
+    from the posts and kept in sync by PostManager. It indexes the same
+    lowercase shadow fields the final search filter checks and uses the
+    trigram tokenizer, so a quoted term matches any substring of at least
+    three characters and a search no longer scans every post. When SQLite
+    lacks FTS5 or the trigram tokenizer (before 3.34), the index stays
+    empty and every search falls back to scanning.
+    """
+
+    def __init__(self, posts=()):
+        """Create the index and fill it with the given posts."""
+        self._connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self._lock = threading.Lock()
+        self.available = True
+        self.reindex(posts)
+
+    @staticmethod
+    def _row(post):
+        """Return the values of a post's index row: its id and lowercase searchable fields."""
+        return (post['id'], *(post[f"_{field}_lc"] for field in SEARCHABLE_FIELDS))
+
+    def reindex(self, posts):
+        """Rebuild the index from scratch from the given posts."""
+        if not self.available:
+            return
+        with self._lock:
+            self._connection.execute("DROP TABLE IF EXISTS posts_fts")
+            try:
+                self._connection.execute(
+                    f"CREATE VIRTUAL TABLE posts_fts USING fts5({', '.join(SEARCHABLE_FIELDS)}, tokenize='trigram')"
+                )
+            except sqlite3.OperationalError as err:
+                logger.warning(f"Full-text search index unavailable, searches will scan all posts: {err}")
+                self.available = False
+                return
+            self._connection.executemany(
+                "INSERT INTO posts_fts (rowid, title, content, author, date) VALUES (?, ?, ?, ?, ?)",
+                [self._row(post) for post in posts]
+            )
+            self._connection.commit()
+
+    def upsert(self, post):
+        """Add a post to the index, replacing any previous version of it."""
+        if not self.available:
+            return
+        with self._lock:
+            self._connection.execute("DELETE FROM posts_fts WHERE rowid = ?", (post['id'],))
+            self._connection.execute(
+                "INSERT INTO posts_fts (rowid, title, content, author, date) VALUES (?, ?, ?, ?, ?)",
+                self._row(post)
+            )
+            self._connection.commit()
+
+    def delete(self, post_id):
+        """Remove a post from the index."""
+        if not self.available:
+            return
+        with self._lock:
+            self._connection.execute("DELETE FROM posts_fts WHERE rowid = ?", (post_id,))
+            self._connection.commit()
+
+    def candidate_ids(self, query_terms=(), **field_terms):
+        """
+        Find the IDs of posts that may match the given lowercase search terms.
+
+        Terms shorter than three characters cannot be looked up with
+        trigrams and are left for the caller to check.
+
+        Args:
+            query_terms (sequence, optional): Terms of which any one may match in any searchable field
+            **field_terms: Terms to match in a specific field, keyed by field name
+
+        Returns:
+            list: Matching post IDs in ascending order, or None if no term could be looked up
+        """
+        if not self.available:
+            return None
+        clauses = []
+        if query_terms and all(len(term) >= 3 for term in query_terms):
+            clauses.append("(" + " OR ".join(map(self._phrase, query_terms)) + ")")
+        for field, term in field_terms.items():
+            if term and len(term) >= 3:
+                clauses.append(f"{field} : {self._phrase(term)}")
+        if not clauses:
+            return None
+        try:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT rowid FROM posts_fts WHERE posts_fts MATCH ? ORDER BY rowid",
+                    (" AND ".join(clauses),)
+                ).fetchall()
+        except sqlite3.OperationalError:
+            # Terms FTS5 cannot parse (e.g. containing NUL) are left for the caller to check
+            return None
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _phrase(term):
+        """Quote a search term as an FTS5 phrase."""
+        return '"' + term.replace('"', '""') + '"'
 
 
 class PostManager:
@@ -110,27 +525,376 @@ class PostManager:
 
     Handles data persistence using JSON file storage and provides methods
     for creating, reading, updating, deleting, and searching blog posts.
+    Changes are appended to a journal file next to the storage file and
+    compacted into it by a background thread at most every FLUSH_INTERVAL
+    seconds (and at exit), so a mutation does not rewrite every post.
+
+    Several processes (e.g. server workers) may share the same storage
+    file: writes and compactions happen under an exclusive cross-process
+    lock, and `sync` picks up changes that other processes appended to the
+    journal or compacted, under a shared one (skipping the check while
+    another process holds the lock). Each compaction records a new
+    generation in the lock file, so a process can tell that the journal it
+    was reading has been folded into the storage file.
     """
 
     def __init__(self, data_file):
         """Initialize PostManager with the path to the JSON storage file."""
         self.data_file = data_file
-        self.posts = self.load_posts()
+        self.journal_file = f"{data_file}.log"
+        self.lock_file = f"{data_file}.lock"
+        self._lock = threading.Lock()
+        self._sorted_cache = {}
+        self._position_cache = {}
+        self.version = 0
+        self._by_id = {}
+        self._next_id = 1
+        self._search_index = PostSearchIndex()
+        self._generation = None
+        self._journal_offset = 0
+        # Kept open, so checking for changes by other processes costs no open() per request;
+        # unbuffered, so every read sees what other processes last wrote
+        self._lock_handle = open(self.lock_file, 'a+b', buffering=0)
+        self._journal = open(self.journal_file, 'ab')
+        with self._lock, self.storage_lock(shared=True):
+            self._sync()
+        self._last_flush = time.monotonic()
+        threading.Thread(target=self._flush_periodically, name="post-flusher", daemon=True).start()
+        atexit.register(self.flush)
+
+    def __len__(self):
+        """Return the number of posts."""
+        return len(self._by_id)
+
+    @property
+    def posts(self):
+        """list: All posts in insertion order, as a cached view of the id index."""
+        return self.get_sorted('', '')
+
+    @staticmethod
+    def index_post(post):
+        """
+        Refresh the lowercase shadow fields of a post used for searching.
+
+        The shadow fields are prefixed with an underscore and never leave
+        the manager; see `to_public`.
+        """
+        for field in SEARCHABLE_FIELDS:
+            post[f"_{field}_lc"] = post[field].lower()
+        # All searchable fields in one string, so a general query is a single scan
+        post["_search_lc"] = "\x1f".join(post[f"_{field}_lc"] for field in SEARCHABLE_FIELDS)
+        return post
+
+    @staticmethod
+    def to_public(post):
+        """Return a copy of the post without internal (underscore-prefixed) fields."""
+        return {key: value for key, value in post.items() if not key.startswith('_')}
 
     def load_posts(self):
         """Load posts from the JSON storage file."""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as file:
+            with open(self.data_file, 'rb') as file:
                 logger.info(f"Loading posts from {self.data_file}")
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
+                posts = orjson.loads(file.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
             logger.warning(f"Failed to load posts from {self.data_file}. Starting with an empty list.")
             return []
+        for post in posts:
+            self.index_post(post)
+        return posts
+
+    def replay_journal(self):
+        """
+        Apply the journal entries that have not been applied yet.
+
+        Reads from the last applied offset, so only changes appended since
+        the previous call are processed. A trailing partial line (an entry
+        still being written) is left for the next call.
+
+        Returns:
+            int: Number of journal entries applied
+        """
+        try:
+            with open(self.journal_file, 'rb') as file:
+                file.seek(self._journal_offset)
+                data = file.read()
+        except FileNotFoundError:
+            return 0
+        complete = data.rfind(b'\n') + 1
+        entries = 0
+        for line in data[:complete].splitlines():
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping unreadable journal entry in {self.journal_file}")
+                continue
+            self._apply(entry)
+            entries += 1
+        self._journal_offset += complete
+        return entries
+
+    def _read_generation(self):
+        """
+        Read the storage generation recorded in the lock file by the last compaction.
+
+        Returns:
+            tuple: (generation, previous generation or None, journal bytes folded in or None)
+        """
+        self._lock_handle.seek(0)
+        fields = self._lock_handle.read().split() or [b'-']
+        if len(fields) < 3:
+            return fields[0], None, None
+        return fields[0], fields[1], int(fields[2])
+
+    def _reload(self):
+        """Reload all posts from the storage file. Must be called with the manager's lock held."""
+        self._by_id = {post['id']: post for post in self.load_posts()}
+        self._next_id = max(self._next_id, max(self._by_id, default=0) + 1)
+        self._search_index.reindex(self._by_id.values())
+        self._journal_offset = 0
+        self._invalidate()
+
+    def _sync(self):
+        """
+        Catch up with the storage files.
+
+        Must be called with the manager's lock and a storage lock held, so no
+        other process is halfway through appending or compacting.
+        """
+        generation, previous, folded = self._read_generation()
+        if generation != self._generation:
+            if previous is not None and previous == self._generation and folded == self._journal_offset:
+                # The compaction folded in exactly the entries already applied here
+                self._journal_offset = 0
+            else:
+                self._reload()
+            self._generation = generation
+        # Other processes truncate the journal in place, so our own handle sees its current size
+        journal_size = os.fstat(self._journal.fileno()).st_size
+        if journal_size < self._journal_offset:
+            self._reload()
+        if journal_size > self._journal_offset:
+            entries = self.replay_journal()
+            logger.info(f"Applied {entries} journal entries from {self.journal_file}")
+
+    def sync(self):
+        """
+        Bring the in-memory posts up to date with changes made by other processes.
+
+        Never waits: while another thread is writing, or another process is
+        writing or compacting (which rewrites every post), the posts are left
+        as they are and the changes are picked up by a later call.
+        """
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._lock_storage(shared=True, blocking=False):
+                try:
+                    self._sync()
+                finally:
+                    self._unlock_storage()
+        finally:
+            self._lock.release()
+
+    @contextmanager
+    def _writing(self):
+        """Hold the manager lock and the exclusive storage lock with the posts up to date, for a mutation."""
+        with self._lock, self.storage_lock():
+            self._sync()
+            yield
 
     def save_posts(self):
-        """Save current posts to the JSON storage file."""
-        with open(self.data_file, 'w', encoding='utf-8') as file:
-            json.dump(self.posts, file, indent=4, ensure_ascii=False)
+        """
+        Save current posts to the JSON storage file.
+
+        Posts are written as compact JSON to a temporary file, synced to
+        disk, and then atomically replace the storage file, so a crash
+        mid-write never leaves a truncated file behind.
+        """
+        temp_file = f"{self.data_file}.tmp"
+        with open(temp_file, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+            file.write(orjson.dumps([self.to_public(post) for post in self.posts]))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.data_file)
+
+    def _lock_storage(self, shared=False, blocking=True):
+        """
+        Take the advisory lock on the storage files, see `storage_lock`.
+
+        Args:
+            shared (bool): Take a shared (read) lock instead of an exclusive one
+            blocking (bool): Wait for the lock instead of giving up if it is held
+
+        Returns:
+            bool: Whether the lock was taken
+        """
+        try:
+            if fcntl:
+                flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                fcntl.flock(self._lock_handle, flags if blocking else flags | fcntl.LOCK_NB)
+            else:
+                self._lock_handle.seek(0)
+                msvcrt.locking(self._lock_handle.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            if blocking:
+                raise
+            return False
+        return True
+
+    def _unlock_storage(self):
+        """Release the advisory lock taken by `_lock_storage`."""
+        if fcntl:
+            fcntl.flock(self._lock_handle, fcntl.LOCK_UN)
+        else:
+            self._lock_handle.seek(0)
+            msvcrt.locking(self._lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    @contextmanager
+    def storage_lock(self, shared=False):
+        """
+        Hold an advisory lock on the storage files.
+
+        Serialises writers across processes (e.g. several server workers)
+        that share the same storage file; readers take the lock shared, so
+        they never see a write or compaction halfway through. On Windows
+        the lock is always exclusive. Must be called with the manager's
+        lock held, as the lock file handle is shared by all its threads.
+
+        Args:
+            shared (bool): Take a shared (read) lock instead of an exclusive one
+
+        Yields:
+            file: The open lock file, which also holds the storage generation
+        """
+        self._lock_storage(shared)
+        try:
+            yield self._lock_handle
+        finally:
+            self._unlock_storage()
+
+    def compact(self):
+        """
+        Fold the journal into the storage file and start a new, empty journal.
+
+        Records a new generation in the lock file, along with the previous
+        one and the journal size folded in, so other processes that had
+        already applied the whole journal can carry on without a reload.
+        Must be called inside `_writing`.
+        """
+        folded = self._journal_offset
+        self.save_posts()
+        self._journal.truncate(0)
+        generation = uuid.uuid4().hex.encode('ascii')
+        self._lock_handle.seek(0)
+        self._lock_handle.truncate(0)
+        self._lock_handle.write(b"%s %s %d" % (generation, self._generation, folded))
+        self._generation = generation
+        self._journal_offset = 0
+        logger.info(f"Compacted journal into {self.data_file}")
+
+    def flush(self):
+        """Compact pending journal entries into the storage file, if there are any."""
+        with self._writing():
+            if self._journal_offset:
+                self.compact()
+        self._last_flush = time.monotonic()
+
+    def _flush_periodically(self):
+        """Background loop that flushes pending changes every FLUSH_INTERVAL seconds."""
+        while True:
+            time.sleep(1)
+            if time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+                try:
+                    self.flush()
+                except OSError as err:
+                    logger.error(f"Failed to flush posts to {self.data_file}: {err}")
+
+    def _apply(self, entry):
+        """
+        Apply a single journal entry to the in-memory posts.
+
+        Entries are idempotent, so replaying a journal that was already
+        folded into the storage file is harmless.
+
+        Args:
+            entry (dict): Journal entry with an 'op' of 'add', 'upd' or 'del'
+
+        Returns:
+            dict: The affected post, or None if it does not exist
+        """
+        op = entry['op']
+        if op == 'add':
+            post = self.index_post(entry['post'])
+            self._by_id[post['id']] = post
+            self._next_id = max(self._next_id, post['id'] + 1)
+            self._search_index.upsert(post)
+        elif op == 'upd':
+            post = self._by_id.get(entry['id'])
+            if post is not None:
+                post.update(entry['fields'])
+                self.index_post(post)
+                self._search_index.upsert(post)
+        elif op == 'del':
+            post = self._by_id.pop(entry['id'], None)
+            self._search_index.delete(entry['id'])
+        else:
+            logger.warning(f"Ignoring unknown journal operation: {op}")
+            return None
+        self._invalidate()
+        return post
+
+    def _invalidate(self):
+        """Drop cached views of the posts and bump the version after a change."""
+        # Replaced rather than cleared, so a view that a concurrent reader built from
+        # the previous posts ends up in a discarded cache
+        self._sorted_cache = {}
+        self._position_cache = {}
+        self.version += 1
+
+    def _record(self, entry):
+        """
+        Append an entry to the journal, then apply it.
+
+        The entry reaches the operating system immediately; the background
+        flush makes it durable in the storage file. Must be called inside
+        `_writing`.
+
+        Args:
+            entry (dict): Journal entry to record
+
+        Returns:
+            dict: The affected post
+        """
+        return self._record_all([entry])[0]
+
+    def _record_all(self, entries):
+        """
+        Append several entries to the journal in one write, then apply them.
+
+        Must be called inside `_writing`.
+
+        Args:
+            entries (list): Journal entries to record
+
+        Returns:
+            list: The affected posts
+        """
+        self._journal.write(b"".join(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in entries))
+        self._journal.flush()
+        self._journal_offset = os.fstat(self._journal.fileno()).st_size
+        return [self._apply(entry) for entry in entries]
+
+    @staticmethod
+    def _new_post(post_id, title, content, author, date):
+        """Build a new post from its fields, as stored."""
+        return {
+            "id": post_id,
+            "title": title.strip(),
+            "content": content.strip(),
+            "author": author.strip(),
+            "date": date.isoformat()
+        }
 
     def add_post(self, title, content, author, date):
         """
@@ -145,17 +909,44 @@ class PostManager:
         Returns:
             dict: The newly created post
         """
-        new_id = max((post['id'] for post in self.posts), default=0) + 1
-        new_post = {
-            "id": new_id,
-            "title": title.strip(),
-            "content": content.strip(),
-            "author": author.strip(),
-            "date": date.strftime("%Y-%m-%d")
-        }
-        self.posts.append(new_post)
-        self.save_posts()
-        return new_post
+        with self._writing():
+            new_post = self._new_post(self._next_id, title, content, author, date)
+            return self._record({"op": "add", "post": new_post})
+
+    def bulk_add(self, items):
+        """
+        Add many blog posts at once, e.g. when importing or seeding posts.
+
+        All posts are appended to the journal in a single write, instead of
+        one write and lock round trip per post as with `add_post`.
+
+        Args:
+            items (iterable): (title, content, author, date) tuples, with the
+                same types as the arguments of `add_post`
+
+        Returns:
+            list: The newly created posts
+        """
+        with self._writing():
+            entries = [
+                {"op": "add", "post": self._new_post(self._next_id + offset, title, content, author, date)}
+                for offset, (title, content, author, date) in enumerate(items)
+            ]
+            if not entries:
+                return []
+            return self._record_all(entries)
+
+    def get_post(self, post_id):
+        """
+        Get a blog post by ID.
+
+        Args:
+            post_id (int): ID of the post to retrieve
+
+        Returns:
+            dict: The post, or None if not found
+        """
+        return self._by_id.get(post_id)
 
     def delete_post(self, post_id):
         """
@@ -167,12 +958,11 @@ class PostManager:
         Returns:
             dict: Success message or error if post not found
         """
-        original_length = len(self.posts)
-        self.posts = [post for post in self.posts if post["id"] != post_id]
-        if len(self.posts) < original_length:
-            self.save_posts()
-            return {"message": f"Post with id {post_id} deleted successfully."}
-        return {"error": f"Post with id {post_id} not found"}, 404
+        with self._writing():
+            if post_id not in self._by_id:
+                return {"error": f"Post with id {post_id} not found"}, 404
+            self._record({"op": "del", "id": post_id})
+        return {"message": f"Post with id {post_id} deleted successfully."}
 
     def update_post(self, post_id, title=None, content=None, author=None, date=None):
         """
@@ -188,20 +978,130 @@ class PostManager:
         Returns:
             dict: Updated post or error if post not found
         """
-        for post in self.posts:
-            if post["id"] == post_id:
-                if title: post["title"] = title.strip()
-                if content: post["content"] = content.strip()
-                if author: post["author"] = author.strip()
-                if date: post["date"] = date.strftime("%Y-%m-%d")
-                self.save_posts()
-                return post
-        return {"error": f"Post with id {post_id} not found"}, 404
+        changes = {}
+        if title: changes["title"] = title.strip()
+        if content: changes["content"] = content.strip()
+        if author: changes["author"] = author.strip()
+        if date: changes["date"] = date.isoformat()
+        with self._writing():
+            if post_id not in self._by_id:
+                return {"error": f"Post with id {post_id} not found"}, 404
+            return self._record({"op": "upd", "id": post_id, "fields": changes})
+
+    def reindex(self):
+        """Rebuild the full-text search index from the current posts."""
+        with self._lock:
+            self._search_index.reindex(self._by_id.values())
+
+    def get_sorted(self, sort_field, sort_direction):
+        """
+        Get the posts sorted by a field, reusing a cached view when possible.
+
+        Text fields are compared case-insensitively via their lowercase
+        shadow fields. Each field is sorted only once: the descending view
+        is the ascending one reversed. The cache is replaced whenever a post
+        is added, updated or deleted; readers need no lock, as they only
+        work on snapshots of the posts and of the cache.
+
+        Args:
+            sort_field (str): Field to sort by; an empty value keeps storage order
+            sort_direction (str): Sort direction ('asc' or 'desc')
+
+        Returns:
+            list: Sorted posts
+        """
+        cache = self._sorted_cache
+        cache_key = (sort_field, 'desc' if sort_direction == 'desc' and sort_field else 'asc')
+        posts = cache.get(cache_key)
+        if posts is None:
+            if not sort_field:
+                posts = list(self._by_id.values())
+            elif cache_key[1] == 'desc':
+                posts = self.get_sorted(sort_field, 'asc')[::-1]
+            else:
+                posts = sorted(self.posts, key=itemgetter(f"_{sort_field}_lc"))
+            cache[cache_key] = posts
+        return posts
+
+    def get_page(self, sort_field, sort_direction, start, count):
+        """
+        Get a slice of the posts in a sorted view.
+
+        Slices the cached sorted view when there is one. Otherwise, a page
+        near the start of a sorted view is selected with a heap instead of
+        sorting every post, with the same order (ties included) as the full
+        sorted view.
+
+        Args:
+            sort_field (str): Field to sort by; an empty value keeps storage order
+            sort_direction (str): Sort direction ('asc' or 'desc')
+            start (int): Index of the first post to return
+            count (int): Maximum number of posts to return
+
+        Returns:
+            tuple: (up to `count` posts starting at `start`, total number of posts,
+                whether more posts follow the page), all from the same snapshot
+        """
+        end = start + count
+        cache_key = (sort_field, 'desc' if sort_direction == 'desc' and sort_field else 'asc')
+        # A snapshot, as other threads may add or remove posts while the page is built
+        posts = list(self._by_id.values())
+        if start >= len(posts):
+            # Past the last post, so there is nothing to sort
+            return [], len(posts), False
+        if sort_field and cache_key not in self._sorted_cache and end * HEAP_PAGE_RATIO <= len(posts):
+            key = itemgetter(f"_{sort_field}_lc")
+            if cache_key[1] == 'desc':
+                # The descending view is the ascending one reversed, so ties come latest first
+                page = heapq.nlargest(end, reversed(posts), key=key)[start:]
+            else:
+                page = heapq.nsmallest(end, posts, key=key)[start:]
+            return page, len(posts), end < len(posts)
+        posts = self.get_sorted(sort_field, sort_direction)
+        return posts[start:end], len(posts), end < len(posts)
+
+    def get_page_after(self, sort_field, sort_direction, after_id, count):
+        """
+        Get the posts that follow a given post in a sorted view.
+
+        Cursor-based counterpart to slicing by page number: the position of
+        the cursor post is looked up in a cached id -> index map, so deep
+        pages cost no more than the first one.
+
+        Args:
+            sort_field (str): Field to sort by; an empty value keeps storage order
+            sort_direction (str): Sort direction ('asc' or 'desc')
+            after_id (int): ID of the last post the client has already seen
+            count (int): Maximum number of posts to return
+
+        Returns:
+            tuple: (up to `count` posts following the cursor, total number of posts,
+                whether more posts follow the page), all from the same snapshot;
+                None if the cursor post does not exist
+        """
+        # Taken before the posts, so positions built from posts that have changed
+        # since are only ever stored in a cache that has been replaced
+        position_cache = self._position_cache
+        posts = self.get_sorted(sort_field, sort_direction)
+        cache_key = (sort_field, sort_direction)
+        positions = position_cache.get(cache_key)
+        if positions is None:
+            positions = {post['id']: index for index, post in enumerate(posts)}
+            position_cache[cache_key] = positions
+        cursor_index = positions.get(after_id)
+        if cursor_index is None:
+            return None
+        end = cursor_index + 1 + count
+        return posts[cursor_index + 1:end], len(posts), end < len(posts)
 
     def search_posts(self, query="", title=None, content=None, author=None, date=None):
         """
         Search posts by various criteria.
 
+        The general query is split on whitespace and a post matches it when
+        any of its terms appears in any searchable field. The field filters
+        each match as a whole, and all given filters must match.
+
         Args:
             query (str): General search query
             title (str, optional): Title search term
@@ -212,82 +1112,247 @@ class PostManager:
         Returns:
             list: Matching posts
         """
-        results = self.posts
-        if query:
-            results = [
-                post for post in results
-                if (query.lower() in post['title'].lower()) or
-                   (query.lower() in post['content'].lower()) or
-                   (query.lower() in post['author'].lower()) or
-                   (query.lower() in post['date'].lower())
-            ]
-        if title:
-            results = [post for post in results if title.lower() in post['title'].lower()]
-        if content:
-            results = [post for post in results if content.lower() in post['content'].lower()]
-        if author:
-            results = [post for post in results if author.lower() in post['author'].lower()]
-        if date:
-            results = [post for post in results if date.lower() in post['date'].lower()]
-        return results
+        query_terms = query.lower().split() if query else []
+        title = title.lower() if title else None
+        content = content.lower() if content else None
+        author = author.lower() if author else None
+        date = date.lower() if date else None
+
+        # Narrow down the candidates with the full-text index when possible, then
+        # check every filter in a single pass; each post stops at the first failing one
+        candidate_ids = self._search_index.candidate_ids(
+            query_terms, title=title, content=content, author=author, date=date
+        )
+        if candidate_ids is None:
+            candidates = self.posts
+        else:
+            posts_by_id = self._by_id
+            candidates = [post for post in map(posts_by_id.get, candidate_ids) if post is not None]
+        return [
+            post for post in candidates
+            if (not query_terms or any(term in post['_search_lc'] for term in query_terms))
+            and (not title or title in post['_title_lc'])
+            and (not content or content in post['_content_lc'])
+            and (not author or author in post['_author_lc'])
+            and (not date or date in post['_date_lc'])
+        ]
 
 
 # Initialize the post manager with configured storage
 post_manager = PostManager(Config.STORAGE_FILE)
 
 
-@app.route('/api/v1/posts', methods=['GET'])
-@limiter.limit("10 per minute")
-def get_posts_v1():
+# Fixed validation errors of the list query parameters, with their response bodies encoded once
+INVALID_PAGINATION = "Invalid pagination parameters. 'page', 'per_page' and 'after' must be integers."
+INVALID_PER_PAGE = "Invalid per_page value. It must be at least 1."
+INVALID_SORT_FIELD = "Invalid sort field"
+INVALID_SORT_DIRECTION = "Invalid sort direction"
+LIST_ARG_ERROR_BODIES = {
+    message: orjson.dumps({"error": message})
+    for message in (INVALID_PAGINATION, INVALID_PER_PAGE, INVALID_SORT_FIELD, INVALID_SORT_DIRECTION)
+}
+
+class ListArgsError(ValueError):
     """
-    Retrieve a paginated list of blog posts.
+    Invalid pagination or sorting query parameters.
 
-    Supports sorting by various fields and pagination parameters.
+    Carries the encoded body of the 400 response, prebuilt for the fixed
+    messages in LIST_ARG_ERROR_BODIES and encoded on the spot for any other.
+    """
 
-    Query Parameters:
-        page (int): Page number (default: 1)
-        per_page (int): Items per page (default: 5)
-        sort (str): Sort field (title, content, author, date)
-        direction (str): Sort direction (asc, desc)
+    def __init__(self, message):
+        """Create the error for a validation message."""
+        super().__init__(message)
+        self.body = LIST_ARG_ERROR_BODIES.get(message) or orjson.dumps({"error": message})
+
+
+# Body of the 404 response for a missing post, formatted with the post id
+POST_NOT_FOUND_BODY = b'{"error":"Post with id %d not found"}'
+
+
+def parse_list_args(args):
+    """
+    Parse and validate the pagination and sorting query parameters.
+
+    Args:
+        args (MultiDict): Request query parameters
 
     Returns:
-        JSON response with paginated posts and metadata
+        tuple: (page, per_page, sort field, sort direction, cursor id or None)
+
+    Raises:
+        ListArgsError: If any parameter is invalid
+    """
+    try:
+        page_num = int(args.get('page', 1))
+        items_per_page = int(args.get('per_page', 5))
+        after_id = int(args['after']) if 'after' in args else None
+    except ValueError:
+        raise ListArgsError(INVALID_PAGINATION)
+    if items_per_page < 1:
+        raise ListArgsError(INVALID_PER_PAGE)
+    sort_field = args.get('sort', '').strip().lower()
+    sort_direction = args.get('direction', '').strip().lower()
+    if sort_field and sort_field not in SORT_FIELDS:
+        raise ListArgsError(INVALID_SORT_FIELD)
+    if sort_direction and sort_direction not in SORT_DIRECTIONS:
+        raise ListArgsError(INVALID_SORT_DIRECTION)
+    return page_num, items_per_page, sort_field, sort_direction, after_id
+
+
+# Number of rendered list and search responses kept in memory
+RESPONSE_CACHE_SIZE = 128
+
+# Distinguishes ETags issued by this process from those of earlier runs
+ETAG_SEED = uuid.uuid4().hex[:8]
+
+# Clients may keep a fetched page of the post list but must revalidate it with its ETag
+# before reuse, so a page reloaded right after a change never shows the old posts
+POSTS_CACHE_CONTROL = 'no-cache'
+
+
+def make_etag(*params):
+    """
+    Build a weak ETag value for a read response.
+
+    The value changes whenever a post is added, updated or deleted, and
+    differs between requests with different parameters.
+
+    Args:
+        *params: Request parameters that shape the response
+
+    Returns:
+        str: ETag value (without quotes or weak prefix)
     """
-    page_num = int(request.args.get('page', 1))
-    items_per_page = int(request.args.get('per_page', 5))
-    sort_field = request.args.get('sort', '').strip().lower()
-    sort_direction = request.args.get('direction', '').strip().lower()
+    return f"{ETAG_SEED}-{post_manager.version}-{zlib.crc32(repr(params).encode('utf-8')):x}"
 
-    if sort_field and sort_field not in ['title', 'content', 'author', 'date']:
-        return jsonify({"error": "Invalid sort field"}), 400
-    if sort_direction and sort_direction not in ['asc', 'desc']:
-        return jsonify({"error": "Invalid sort direction"}), 400
 
-    sorted_posts = sorted(post_manager.posts,
-                          key=lambda post: post.get(sort_field, ""),
-                          reverse=(sort_direction == 'desc')) if sort_field else post_manager.posts
+def not_modified(etag):
+    """Build an empty 304 response for a client that already has the current data."""
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def encode_posts_page(metadata, posts):
+    """
+    Encode a page of posts as JSON.
+
+    Args:
+        metadata (dict): Pagination fields to include alongside the posts
+        posts (list): Posts for the page
+
+    Returns:
+        bytes: JSON object with the metadata fields and a "posts" array
+    """
+    return orjson.dumps({**metadata, "posts": [post_manager.to_public(post) for post in posts]})
+
 
-    total_posts = len(sorted_posts)
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def render_posts_list(version, page_num, items_per_page, sort_field, sort_direction, after_id):
+    """
+    Render a page of the post list to JSON.
+
+    Results are cached per posts version and query parameters. `version`
+    is only used as part of the cache key, so any change to the posts
+    makes later requests miss the cache.
+
+    Returns:
+        tuple: (JSON body as bytes, HTTP status code)
+    """
+    # The page, the total and whether more posts follow all come from one
+    # snapshot, as other threads may add or remove posts in between
+    if after_id is not None:
+        result = post_manager.get_page_after(sort_field, sort_direction, after_id, items_per_page)
+        if result is None:
+            return orjson.dumps({"error": f"Invalid cursor. Post with id {after_id} not found."}), 400
+        paginated_posts, total_posts, has_more = result
+        return encode_posts_page({
+            "after": after_id,
+            "per_page": items_per_page,
+            "total_posts": total_posts,
+            "next_after": paginated_posts[-1]["id"] if has_more else None
+        }, paginated_posts), 200
+
+    start_index = (max(page_num, 1) - 1) * items_per_page
+    paginated_posts, total_posts, has_more = post_manager.get_page(sort_field, sort_direction, start_index, items_per_page)
     total_pages = ceil(total_posts / items_per_page) or 1
 
     if page_num < 1 or page_num > total_pages:
-        return jsonify({"error": f"Invalid page number. Choose between 1 and {total_pages}."}), 400
+        return orjson.dumps({"error": f"Invalid page number. Choose between 1 and {total_pages}."}), 400
 
-    start_index = (page_num - 1) * items_per_page
-    end_index = start_index + items_per_page
-    paginated_posts = sorted_posts[start_index:end_index]
-
-    return jsonify({
+    return encode_posts_page({
         "page": page_num,
         "per_page": items_per_page,
         "total_posts": total_posts,
         "total_pages": total_pages,
-        "posts": paginated_posts
-    }), 200
+        "next_after": paginated_posts[-1]["id"] if has_more else None
+    }, paginated_posts), 200
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def render_search_results(version, query, title, content, author, date):
+    """
+    Render the posts matching a search to JSON.
+
+    Cached like `render_posts_list`, keyed by posts version and search terms.
+
+    Returns:
+        bytes: JSON array of matching posts
+    """
+    matching_posts = post_manager.search_posts(
+        query=query,
+        title=title,
+        content=content,
+        author=author,
+        date=date
+    )
+    return orjson.dumps([post_manager.to_public(post) for post in matching_posts])
+
+
+@app.route('/api/v1/posts', methods=['GET'])
+@rate_limit("10 per minute")
+def get_posts_v1():
+    """
+    Retrieve a paginated list of blog posts.
+
+    Supports sorting by various fields and pagination parameters.
+    When `after` is given, the page starts right after that post instead
+    of at a page number; `next_after` in the response continues from there.
+
+    Query Parameters:
+        page (int): Page number (default: 1)
+        per_page (int): Items per page (default: 5)
+        sort (str): Sort field (title, content, author, date)
+        direction (str): Sort direction (asc, desc)
+        after (int): ID of the last post already received (optional)
+
+    Returns:
+        JSON response with paginated posts and metadata
+    """
+    try:
+        page_num, items_per_page, sort_field, sort_direction, after_id = parse_list_args(request.args)
+    except ListArgsError as err:
+        return prebuilt_response(err.body, 400)
+
+    post_manager.sync()
+    etag = make_etag('posts', page_num, items_per_page, sort_field, sort_direction, after_id)
+    if request.if_none_match.contains_weak(etag):
+        response = not_modified(etag)
+        response.headers['Cache-Control'] = POSTS_CACHE_CONTROL
+        return response
+
+    body, status = render_posts_list(post_manager.version, page_num, items_per_page,
+                                     sort_field, sort_direction, after_id)
+    response = Response(body, status=status, mimetype='application/json')
+    if status == 200:
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = POSTS_CACHE_CONTROL
+    return response
 
 
 @app.route('/api/v1/posts/<int:post_id>', methods=['GET'])
-@limiter.limit("10 per minute")
+@rate_limit("10 per minute")
 def get_post_by_id(post_id):
     """
     Retrieve a single blog post by ID.
@@ -299,16 +1364,23 @@ def get_post_by_id(post_id):
         JSON response with the post data or an error if not found
     """
     logger.info(f"Fetching post with ID: {post_id}")
-    post = next((post for post in post_manager.posts if post["id"] == post_id), None)
+    post_manager.sync()
+    etag = make_etag('post', post_id)
+    if request.if_none_match.contains_weak(etag):
+        return not_modified(etag)
+    post = post_manager.get_post(post_id)
     if post:
+        post = post_manager.to_public(post)
         logger.info(f"Post found: {post}")
-        return jsonify(post), 200
+        response = json_response(post)
+        response.set_etag(etag, weak=True)
+        return response
     logger.warning(f"Post with ID {post_id} not found.")
-    return jsonify({"error": f"Post with id {post_id} not found"}), 404
+    return prebuilt_response(POST_NOT_FOUND_BODY % post_id, 404)
 
 
 @app.route('/api/v1/posts', methods=['POST'])
-@limiter.limit("10 per minute")
+@rate_limit("10 per minute")
 def add_post_v1():
     """
     Create a new blog post.
@@ -317,15 +1389,15 @@ def add_post_v1():
     Returns the created post or validation errors.
     """
     try:
-        post_data = post_schema.load(request.get_json())
+        post_data = load_post_data(parse_json_body())
         new_post = post_manager.add_post(**post_data)
-        return jsonify(new_post), 201
+        return json_response(post_manager.to_public(new_post), 201)
     except ValidationError as err:
-        return jsonify({"error": err.messages}), 400
+        return json_response({"error": err.messages}, 400)
 
 
 @app.route('/api/v1/posts/<int:post_id>', methods=['DELETE'])
-@limiter.limit("10 per minute")
+@rate_limit("10 per minute")
 def delete_post_v1(post_id):
     """
     Delete a blog post by ID.
@@ -338,12 +1410,12 @@ def delete_post_v1(post_id):
     """
     delete_result = post_manager.delete_post(post_id)
     if isinstance(delete_result, tuple):
-        return jsonify(delete_result[0]), delete_result[1]
-    return jsonify(delete_result), 200
+        return json_response(delete_result[0], delete_result[1])
+    return json_response(delete_result, 200)
 
 
 @app.route('/api/v1/posts/<int:post_id>', methods=['PUT'])
-@limiter.limit("10 per minute")
+@rate_limit("10 per minute")
 def update_post_v1(post_id):
     """
     Update an existing blog post.
@@ -355,17 +1427,17 @@ def update_post_v1(post_id):
     Returns the updated post or validation errors.
     """
     try:
-        update_data = post_schema.load(request.get_json(), partial=True)
+        update_data = load_post_update(parse_json_body())
         update_result = post_manager.update_post(post_id, **update_data)
         if isinstance(update_result, tuple):
-            return jsonify(update_result[0]), update_result[1]
-        return jsonify(update_result), 200
+            return json_response(update_result[0], update_result[1])
+        return json_response(post_manager.to_public(update_result), 200)
     except ValidationError as err:
-        return jsonify({"error": err.messages}), 400
+        return json_response({"error": err.messages}, 400)
 
 
 @app.route('/api/v1/posts/search', methods=['GET'])
-@limiter.limit("10 per minute")
+@rate_limit("10 per minute")
 def search_posts_v1():
     """
     Search for blog posts using various criteria.
@@ -386,14 +1458,16 @@ def search_posts_v1():
     search_author = request.args.get('author', '').strip().lower()
     search_date = request.args.get('date', '').strip().lower()
 
-    matching_posts = post_manager.search_posts(
-        query=search_query,
-        title=search_title,
-        content=search_content,
-        author=search_author,
-        date=search_date
-    )
-    return jsonify(matching_posts), 200
+    post_manager.sync()
+    etag = make_etag('search', search_query, search_title, search_content, search_author, search_date)
+    if request.if_none_match.contains_weak(etag):
+        return not_modified(etag)
+
+    body = render_search_results(post_manager.version, search_query, search_title,
+                                 search_content, search_author, search_date)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
 
 
 if __name__ == '__main__':
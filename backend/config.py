@@ -6,6 +6,7 @@ and defining configuration parameters for the application.
 """
 
 import os
+import re
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -36,6 +37,8 @@ class Config:
         API_KEY (str): API key for authentication
         DEBUG (bool): Debug mode flag
         RATE_LIMITS (list): Rate limiting rules
+        BEHIND_PROXY (bool): Whether requests arrive through a reverse proxy that sets X-Forwarded-For
+        MAX_CONTENT_LENGTH (int): Largest accepted request body in bytes
         STORAGE_FILE (Path): Path to JSON storage file
     """
 
@@ -48,4 +51,8 @@ class Config:
     DEBUG = os.getenv("DEBUG", "True").lower() in ("true", "1", "yes")
 
     # Rate limiting settings
-    RATE_LIMITS = os.getenv("RATE_LIMITS", "20 per minute").split(",")
\ No newline at end of file
+    RATE_LIMITS = re.split(r"[,;]", os.getenv("RATE_LIMITS", "20 per minute"))
+    BEHIND_PROXY = os.getenv("BEHIND_PROXY", "False").lower() in ("true", "1", "yes")
+
+    # Request limits
+    MAX_CONTENT_LENGTH = 64 * 1024
\ No newline at end of file
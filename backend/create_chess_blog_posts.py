@@ -1,4 +1,5 @@
 import json
+import uuid
 from datetime import datetime, timedelta
 
 
@@ -38,8 +39,18 @@ def generate_chess_posts(num_posts=50):
 
 
 # Save posts to a JSON file
+# This replaces the whole storage file in one write, so stop the server first. The
+# server's journal of changes since its last compaction is emptied too, or those
+# changes would be replayed over the new posts, and a new storage generation makes
+# any process still running reload the file. To add the generated posts to existing
+# ones instead, pass them to PostManager.bulk_add in a single call rather than
+# calling add_post once per post.
 if __name__ == "__main__":
     posts = generate_chess_posts()
     with open("posts_storage.json", "w", encoding="utf-8") as file:
         json.dump(posts, file, indent=4, ensure_ascii=False)
-    print("Generated 50 chess posts and saved them to 'posts_storage.json'.")
\ No newline at end of file
+    # Emptied in place rather than deleted, as running processes keep both files open
+    open("posts_storage.json.log", "wb").close()
+    with open("posts_storage.json.lock", "wb") as file:
+        file.write(uuid.uuid4().hex.encode("ascii"))
+    print("Generated 50 chess posts and saved them to 'posts_storage.json'.")
@@ -0,0 +1,36 @@
+"""
+Gunicorn configuration for serving the Flask Blog API in production.
+
+Gunicorn reads this file automatically when started from the backend
+directory, so the WSGI application only needs to be named:
+
+    gunicorn backend_app:app
+
+Settings can be overridden with environment variables (GUNICORN_BIND,
+WEB_CONCURRENCY, GUNICORN_THREADS) or on the command line.
+"""
+
+import os
+
+
+# Listen on TCP by default; use e.g. "unix:/run/masterblog.sock" behind a local reverse proxy
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5001")
+
+# A single worker by default. Several workers stay consistent through the shared
+# journal (see PostManager.sync), but rate limits are counted per worker, so
+# each client gets the configured limit once per worker; ETags are per worker,
+# so a 304 only comes from the worker that issued the ETag; a worker answering
+# while another one writes or compacts does not wait for it, so it may miss
+# that worker's latest changes until its next request; and a compaction by one
+# worker can make the others reload every post
+workers = int(os.getenv("WEB_CONCURRENCY", 1))
+
+# Threaded workers serve several requests at once, like the development server
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+
+# The app is imported in each worker rather than once before forking: the
+# PostManager starts a background flush thread and holds locks, neither of
+# which survives a fork, and loading the posts is cheap next to a worker's
+# lifetime
+preload_app = False
@@ -0,0 +1,54 @@
+"""Shared fixtures for the backend tests."""
+
+import importlib
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def copy_backend(target, debug=True):
+    """Copy the backend into a directory with its own .env and empty storage file."""
+    for name in ("backend_app.py", "config.py"):
+        shutil.copy(BACKEND_DIR / name, target / name)
+    shutil.copytree(BACKEND_DIR / "static", target / "static")
+    (target / ".env").write_text(f"API_KEY=test-key\nDEBUG={debug}\n")
+    (target / "posts_storage.json").write_bytes(b"[]")
+    return target
+
+
+@pytest.fixture
+def backend_dir(tmp_path):
+    """A throwaway copy of the backend, so tests never touch the real posts."""
+    return copy_backend(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def backend_app(tmp_path_factory):
+    """The backend_app module, imported from a throwaway copy of the backend."""
+    sys.path.insert(0, str(copy_backend(tmp_path_factory.mktemp("backend"))))
+    import backend_app
+    yield backend_app
+    # Managers created by the tests flush at exit, after pytest has closed the captured stream
+    backend_app.logger.removeHandler(backend_app.handler)
+
+
+@pytest.fixture(scope="session")
+def secured_backend_app(tmp_path_factory):
+    """The backend_app module with API keys required (DEBUG=False), imported from its own copy."""
+    target = copy_backend(tmp_path_factory.mktemp("secured"), debug=False)
+    with pytest.MonkeyPatch.context() as patch:
+        # load_dotenv keeps variables that are already set, e.g. by importing the other copy
+        patch.setenv("DEBUG", "False")
+        patch.setenv("API_KEY", "test-key")
+        patch.syspath_prepend(str(target))
+        # A separate import, after which the modules of the other copy are put back
+        for name in ("backend_app", "config"):
+            patch.delitem(sys.modules, name, raising=False)
+        module = importlib.import_module("backend_app")
+    yield module
+    module.logger.removeHandler(module.handler)
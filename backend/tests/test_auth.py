@@ -0,0 +1,43 @@
+"""Tests for APIKeyMiddleware, which guards the API when DEBUG is off."""
+
+import pytest
+
+
+@pytest.fixture
+def client(secured_backend_app):
+    """A test client of the secured app, with rate limits on and no requests counted yet."""
+    secured_backend_app.RATE_LIMIT_COUNTERS.clear()
+    secured_backend_app.app.config["RATELIMIT_ENABLED"] = True
+    return secured_backend_app.app.test_client()
+
+
+def test_valid_key_is_accepted_from_header_or_query(client):
+    assert client.get("/api/v1/posts", headers={"X-API-Key": "test-key"}).status_code == 200
+    assert client.get("/api/v1/posts?api_key=test-key").status_code == 200
+
+
+@pytest.mark.parametrize("url, headers", [
+    ("/api/v1/posts", {}),
+    ("/api/v1/posts", {"X-API-Key": "wrong-key"}),
+    ("/api/v1/posts?api_key=wrong-key", {}),
+])
+def test_missing_or_wrong_key_is_rejected(secured_backend_app, client, url, headers):
+    response = client.get(url, headers=headers)
+    assert response.status_code == 401
+    assert response.data == secured_backend_app.UNAUTHORIZED_BODY
+    assert response.headers["Access-Control-Allow-Origin"] == "*"
+
+
+def test_preflight_and_docs_need_no_key(client):
+    assert client.options("/api/v1/posts").status_code == 200
+    assert client.get("/swagger.json").status_code == 200
+    assert client.get("/api/docs/").status_code == 200
+
+
+def test_repeated_rejections_are_rate_limited(client):
+    statuses = [client.get("/api/v1/posts", headers={"X-API-Key": "wrong-key"}).status_code for _ in range(11)]
+    assert statuses == [401] * 10 + [429]
+    response = client.get("/api/v1/posts", headers={"X-API-Key": "wrong-key"})
+    assert response.status_code == 429
+    assert response.headers["Access-Control-Allow-Origin"] == "*"
+    assert response.json["error"] == "Too Many Requests"
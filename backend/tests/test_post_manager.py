@@ -0,0 +1,200 @@
+"""Tests for PostManager's journal and its sync between processes sharing a storage file."""
+
+import datetime
+import subprocess
+import sys
+import threading
+import time
+
+import orjson
+
+
+WRITER = """
+import datetime, sys, time
+sys.path.insert(0, sys.argv[1])
+from backend_app import post_manager
+name, count = sys.argv[2], int(sys.argv[3])
+time.sleep(max(0.0, float(sys.argv[4]) - time.time()))
+for i in range(count):
+    post_manager.add_post(f"{name}-{i}", "content", name, datetime.date(2024, 1, 1))
+    if i % 3 == 2:
+        post_manager.flush()
+"""
+
+READER = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+import orjson
+from backend_app import post_manager
+expected, deadline = int(sys.argv[2]), time.monotonic() + 60
+while time.monotonic() < deadline:
+    post_manager.sync()
+    post_manager.flush()
+    if len(post_manager) >= expected:
+        break
+sys.stdout.buffer.write(orjson.dumps(sorted(post["title"] for post in post_manager.posts)))
+"""
+
+
+def run_reader(backend_dir, expected):
+    """Load the posts in a fresh process and return their titles."""
+    result = subprocess.run([sys.executable, "-c", READER, str(backend_dir), str(expected)],
+                            capture_output=True, check=True, timeout=120)
+    return orjson.loads(result.stdout)
+
+
+def test_concurrent_writers_and_reader_see_every_post(backend_dir):
+    count = 200
+    expected = sorted(f"{name}-{i}" for name in ("a", "b") for i in range(count))
+    reader = subprocess.Popen([sys.executable, "-c", READER, str(backend_dir), str(len(expected))],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    # Start writing at the same moment in both writers, once they have imported the app
+    start = str(time.time() + 2)
+    writers = [
+        subprocess.Popen([sys.executable, "-c", WRITER, str(backend_dir), name, str(count), start],
+                         stderr=subprocess.DEVNULL)
+        for name in ("a", "b")
+    ]
+    for writer in writers:
+        assert writer.wait(timeout=120) == 0
+
+    stdout, _ = reader.communicate(timeout=120)
+    assert orjson.loads(stdout) == expected
+    assert run_reader(backend_dir, len(expected)) == expected
+
+
+def test_sync_during_compaction_keeps_later_writes(backend_app, tmp_path):
+    data_file = tmp_path / "posts.json"
+    data_file.write_bytes(b"[]")
+    writer = backend_app.PostManager(str(data_file))
+    reader = backend_app.PostManager(str(data_file))
+    date = datetime.date(2024, 1, 1)
+    writer.add_post("before", "content", "author", date)
+
+    # Let the reader sync while the writer is between replacing the storage file and
+    # truncating the journal
+    save_posts = writer.save_posts
+
+    def save_posts_then_sync():
+        save_posts()
+        syncing = threading.Thread(target=reader.sync)
+        syncing.start()
+        syncing.join(0.2)
+
+    writer.save_posts = save_posts_then_sync
+    writer.flush()
+    writer.save_posts = save_posts
+    for title in ("X1", "X2", "X3"):
+        writer.add_post(title, "content", "author", date)
+    time.sleep(0.3)
+    reader.sync()
+    reader.flush()
+
+    fresh = backend_app.PostManager(str(data_file))
+    assert sorted(post["title"] for post in fresh.posts) == ["X1", "X2", "X3", "before"]
+    assert sorted(post["title"] for post in reader.posts) == ["X1", "X2", "X3", "before"]
+
+
+def test_journal_survives_restart_without_flush(backend_app, tmp_path):
+    data_file = tmp_path / "posts.json"
+    data_file.write_bytes(b"[]")
+    manager = backend_app.PostManager(str(data_file))
+    date = datetime.date(2024, 1, 1)
+    first = manager.add_post("first", "content", "author", date)
+    second = manager.add_post("second", "content", "author", date)
+    manager.update_post(first["id"], title="renamed")
+    manager.delete_post(second["id"])
+
+    restarted = backend_app.PostManager(str(data_file))
+    assert [post["title"] for post in restarted.posts] == ["renamed"]
+    assert restarted.add_post("third", "content", "author", date)["id"] == second["id"] + 1
+
+
+def test_up_to_date_process_skips_reload_after_compaction(backend_app, tmp_path, monkeypatch):
+    data_file = tmp_path / "posts.json"
+    data_file.write_bytes(b"[]")
+    writer = backend_app.PostManager(str(data_file))
+    reader = backend_app.PostManager(str(data_file))
+    date = datetime.date(2024, 1, 1)
+    writer.add_post("first", "content", "author", date)
+    reader.sync()
+
+    reloads = []
+    monkeypatch.setattr(reader, "_reload", lambda: reloads.append(True))
+    writer.flush()
+    writer.add_post("second", "content", "author", date)
+    reader.sync()
+    assert reloads == []
+    assert [post["title"] for post in reader.posts] == ["first", "second"]
+
+
+def test_sync_does_not_wait_for_another_process_compacting(backend_app, tmp_path):
+    data_file = tmp_path / "posts.json"
+    data_file.write_bytes(b"[]")
+    writer = backend_app.PostManager(str(data_file))
+    reader = backend_app.PostManager(str(data_file))
+    date = datetime.date(2024, 1, 1)
+    writer.add_post("first", "content", "author", date)
+
+    with writer._writing():
+        syncing = threading.Thread(target=reader.sync)
+        syncing.start()
+        syncing.join(1)
+        assert not syncing.is_alive()
+    assert reader.posts == []
+
+    reader.sync()
+    assert [post["title"] for post in reader.posts] == ["first"]
+
+
+def test_reads_are_safe_while_another_thread_writes(backend_app, tmp_path, monkeypatch):
+    data_file = tmp_path / "posts.json"
+    data_file.write_bytes(b"[]")
+    manager = backend_app.PostManager(str(data_file))
+    monkeypatch.setattr(backend_app, "post_manager", manager)
+    date = datetime.date(2024, 1, 1)
+    last_id = manager.bulk_add((f"title {i}", "content", f"author {i % 7}", date) for i in range(5000))[-1]["id"]
+    stop = threading.Event()
+    errors = []
+
+    def write():
+        i = 0
+        while not stop.is_set():
+            # Posts come and go at the end of the list, so the last pages keep appearing and vanishing
+            added = manager.bulk_add((f"new {i}-{j}", "content", "author", date) for j in range(10))
+            manager.update_post(added[0]["id"], title=f"renamed {i}")
+            for post in added:
+                manager.delete_post(post["id"])
+            i += 1
+
+    def read():
+        while not stop.is_set():
+            try:
+                manager.get_page("title", "desc", 0, 5)
+                manager.get_sorted("author", "asc")
+                manager.get_page_after("author", "asc", 1, 5)
+                manager.search_posts("title")
+                # Past the response cache, so every call builds its page
+                backend_app.render_posts_list.__wrapped__(manager.version, 2, 5, "title", "desc", None)
+                backend_app.render_posts_list.__wrapped__(manager.version, 5001, 1, "", "", None)
+                backend_app.render_posts_list.__wrapped__(manager.version, 1, 5, "", "", last_id)
+                backend_app.render_search_results.__wrapped__(manager.version, "new", "", "", "", "")
+            except Exception as err:
+                errors.append(err)
+
+    threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        time.sleep(2)
+        stop.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    titles = [post["title"] for post in manager.get_sorted("title", "asc")]
+    assert titles == sorted(post["title"] for post in manager.posts)